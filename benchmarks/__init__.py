@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. __init__
+
+Initialisation module for the benchmark package of `pydatutils`, measuring the
+throughput of the online layer against a local HTTP stand-in.
+
+**Usage**
+
+    >>> python -m benchmarks --batch 1 10 100 --size 1024 1048576 --output results.json
+"""
+
+
+
+__all__ = ['server', 'ftpserver', 'online']
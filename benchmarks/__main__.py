@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. __main__
+
+Command line entry point of the benchmark package.
+
+    >>> python -m benchmarks --method get_response read_url --path sync async \
+            --batch 1 10 100 --size 1024 1048576 --latency 0.01 --output new.json
+    >>> python -m benchmarks --compare old.json new.json
+"""
+
+#%% Settings
+
+import argparse
+
+from benchmarks.online import Bench, METHODS, PATHS, BATCHES, SIZES, TRANSPORTS
+
+
+#%% Core functions/classes
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='benchmarks',
+                                     description='Benchmark the online layer against a local HTTP stand-in.')
+    parser.add_argument('--method', nargs='+', choices=METHODS, default=METHODS)
+    parser.add_argument('--path', nargs='+', choices=PATHS, default=PATHS)
+    parser.add_argument('--batch', nargs='+', type=int, default=BATCHES)
+    parser.add_argument('--size', nargs='+', type=int, default=SIZES)
+    parser.add_argument('--transport', nargs='+', default=TRANSPORTS,
+                        help='transports of the service to compare, e.g. requests urllib3 aiohttp')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--latency', type=float, default=0.)
+    parser.add_argument('--error', type=float, default=0.)
+    parser.add_argument('--fmt', default='json')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help='JSON file the results are written into')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), default=None,
+                        help='compare two JSON result files instead of running the benchmark')
+    args = parser.parse_args(argv)
+    if args.compare is not None:
+        for r in Bench.compare(*args.compare):
+            # no ratio when the old timing is zero
+            print('%(method)-15s %(path)-7s %(transport)-8s batch=%(batch)-5d size=%(size)-9d'
+                  ' old=%(old).4fs new=%(new).4fs ratio=%(ratio)s'
+                  % dict(r, transport=r['transport'] or '-',
+                         ratio='n/a' if r['ratio'] is None else '%.2f' % r['ratio']))
+        return
+    bench = Bench(methods=args.method, paths=args.path, batches=args.batch, sizes=args.size,
+                  transports=args.transport, repeat=args.repeat, latency=args.latency, error=args.error, fmt=args.fmt,
+                  seed=args.seed)
+    results = bench.run(verbose=True)
+    if args.output is not None:
+        Bench.dump(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. _ftpserver
+
+Module implementing a local FTP stand-in used to benchmark (and check) the FTP
+transport of the online layer.
+
+The server exposes a temporary directory, populated with synthetic files, to an
+anonymous user and a :literal:`user:passwd` account, e.g.:
+
+    ftp://127.0.0.1:<port>/data/42.bin
+
+**Dependencies**
+
+*require*:      :mod:`threading`, :mod:`tempfile`, :mod:`random`
+
+*optional*:     :mod:`pyftpdlib`
+
+**Contents**
+"""
+
+#%% Settings
+
+import os
+import random
+import shutil
+import tempfile
+import threading
+
+try:
+    from pyftpdlib.authorizers import DummyAuthorizer
+    from pyftpdlib.handlers import FTPHandler
+    from pyftpdlib.servers import ThreadedFTPServer
+except ImportError:
+    PYFTPDLIB_INSTALLED = False
+else:
+    PYFTPDLIB_INSTALLED = True
+
+
+#%% Core functions/classes
+
+#==============================================================================
+# Class LocalFTPServer
+#==============================================================================
+
+class LocalFTPServer():
+    """Threaded local FTP server delivering synthetic files.
+
+        >>> server = LocalFTPServer(max_cons=16)
+        >>> with server:
+        ...     url = server.url(server.add('data/1.bin', size=2048))
+
+    Keyword arguments
+    -----------------
+    max_cons : int
+        maximum number of simultaneous connections; default: :data:`max_cons=16`.
+    seed : int
+        seed of the random generator used to fill the files; default: :data:`seed=0`.
+    host,port :
+        address the server is bound to; default: :data:`host='127.0.0.1'` and
+        :data:`port=0`, *i.e.* any free port.
+    """
+
+    USER, PASSWD = 'user', 'passwd'
+
+    #/************************************************************************/
+    def __init__(self, **kwargs):
+        if PYFTPDLIB_INSTALLED is False:
+            raise IOError("Module pyftpdlib required by the FTP stand-in")
+        host, port = kwargs.pop('host', '127.0.0.1'), kwargs.pop('port', 0)
+        self.root = tempfile.mkdtemp(prefix='pydatutils-ftp-')
+        self.__random = random.Random(kwargs.pop('seed', 0))
+        authorizer = DummyAuthorizer()
+        authorizer.add_user(self.USER, self.PASSWD, self.root, perm='elr')
+        authorizer.add_anonymous(self.root)
+        handler = type('_Handler', (FTPHandler,), {'authorizer': authorizer, 'log_prefix': ''})
+        self.__server = ThreadedFTPServer((host, port), handler)
+        self.__server.max_cons = kwargs.pop('max_cons', 16)
+        self.__thread = None
+
+    #/************************************************************************/
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    #/************************************************************************/
+    @property
+    def address(self):
+        host, port = self.__server.address[:2]
+        return 'ftp://%s:%s' % (host, port)
+
+    #/************************************************************************/
+    def url(self, path='', auth=False):
+        """Build the URL of a file delivered by the server.
+
+            >>> url = server.url(path='', auth=False)
+        """
+        address = self.address
+        if auth is True:
+            address = address.replace('ftp://', 'ftp://%s:%s@' % (self.USER, self.PASSWD))
+        return '%s/%s' % (address, path.lstrip('/'))
+
+    #/************************************************************************/
+    def add(self, path, size=1024, content=None):
+        """Write a (synthetic) file in the root directory of the server.
+
+            >>> path = server.add(path, size=1024, content=None)
+        """
+        dest = os.path.join(self.root, path.lstrip('/'))
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        if content is None:
+            content = bytes(self.__random.getrandbits(8) for _ in range(size))
+        with open(dest, 'wb') as f:
+            f.write(content)
+        return path
+
+    #/************************************************************************/
+    def start(self):
+        """Serve requests in a background (daemon) thread.
+        """
+        if self.__thread is None:
+            self.__thread = threading.Thread(target=self.__server.serve_forever,
+                                             kwargs={'timeout': 0.1, 'handle_exit': False}, daemon=True)
+            self.__thread.start()
+        return self
+
+    #/************************************************************************/
+    def stop(self):
+        """Shut the server down and remove its root directory.
+        """
+        self.__server.close_all()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+        shutil.rmtree(self.root, ignore_errors=True)
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. _online
+
+Module implementing the throughput benchmarks of :class:`pydatutils.online.Service`.
+
+The methods :meth:`~Service.get_status`, :meth:`~Service.get_response`,
+:meth:`~Service.cache_response` and :meth:`~Service.read_url` are measured across
+the sequential (:literal:`sync`), asynchronous (:literal:`async`) and warm cache
+(:literal:`cached`) paths for different batch sizes, against a :class:`LocalServer`
+stand-in. Results are written as JSON so that they can be compared across versions.
+
+**Dependencies**
+
+*require*:      :mod:`json`, :mod:`time`, :mod:`statistics`, :mod:`tempfile`
+
+*call*:         :mod:`pydatutils.online`, :mod:`benchmarks.server`
+
+**Contents**
+"""
+
+#%% Settings
+
+import os, sys
+import json
+import time
+import platform
+import statistics
+import subprocess
+import tempfile
+import shutil
+
+from pydatutils import online
+from benchmarks.server import LocalServer
+
+
+METHODS         = ['get_status', 'get_response', 'cache_response', 'read_url']
+
+PATHS           = ['sync', 'async', 'cached']
+
+BATCHES         = [1, 10, 100]
+
+SIZES           = [1024, 1024**2]
+
+TRANSPORTS      = [None] # default transport of each path
+
+
+#%% Core functions/classes
+
+#==============================================================================
+# Class Bench
+#==============================================================================
+
+class Bench():
+    """Benchmark runner of the online layer.
+
+        >>> bench = Bench(methods=METHODS, paths=PATHS, batches=BATCHES, sizes=SIZES,
+                          repeat=3, latency=0., error=0., fmt='json')
+        >>> results = bench.run()
+        >>> Bench.dump(results, 'results.json')
+
+    Keyword arguments
+    -----------------
+    methods : list[str]
+        :class:`~pydatutils.online.Service` methods to measure; default: :data:`METHODS`.
+    paths : list[str]
+        execution paths to measure; default: :data:`PATHS`.
+    batches : list[int]
+        number of URLs passed in a single call; default: :data:`BATCHES`.
+    sizes : list[int]
+        payload sizes (in bytes); default: :data:`SIZES`.
+    transports : list[str]
+        transports of the service (see :data:`Service.TRANSPORTS`) to compare;
+        a transport is only measured on the paths it implements; default:
+        :data:`TRANSPORTS`.
+    repeat : int
+        number of timed repetitions per configuration; default: :data:`repeat=3`.
+    latency,error,fmt,seed :
+        settings of the :class:`~benchmarks.server.LocalServer` stand-in.
+    """
+
+    #/************************************************************************/
+    def __init__(self, **kwargs):
+        self.methods = kwargs.pop('methods', None) or METHODS
+        self.paths = kwargs.pop('paths', None) or PATHS
+        self.batches = kwargs.pop('batches', None) or BATCHES
+        self.sizes = kwargs.pop('sizes', None) or SIZES
+        self.transports = kwargs.pop('transports', None) or TRANSPORTS
+        self.repeat = kwargs.pop('repeat', 3)
+        self.server_kwargs = {'latency':    kwargs.pop('latency', 0.),
+                              'error':      kwargs.pop('error', 0.),
+                              'fmt':        kwargs.pop('fmt', 'json'),
+                              'seed':       kwargs.pop('seed', 0)
+                              }
+        try:
+            assert set(self.methods).issubset(METHODS) and set(self.paths).issubset(PATHS)
+        except:
+            raise IOError("Wrong benchmark setting - methods must be in %s and paths in %s" % (METHODS, PATHS))
+        try:
+            assert all([t is None or t in online.Service.TRANSPORTS for t in self.transports])
+        except:
+            raise IOError("Wrong benchmark setting - transports must be in %s" % list(online.Service.TRANSPORTS))
+        self.__nurl = 0
+        # the cached path runs on whichever path the online layer defaults to
+        self.__asyncio = getattr(online, 'ASYNCIO_AVAILABLE', False)
+
+    #/************************************************************************/
+    @staticmethod
+    def meta():
+        """Describe the environment the benchmark is run in.
+        """
+        try:
+            version = subprocess.check_output(['git', 'describe', '--always', '--dirty'],
+                                              cwd=os.path.dirname(online.__file__),
+                                              stderr=subprocess.DEVNULL).decode().strip()
+        except:
+            version = None
+        return {'version':      version,
+                'python':       sys.version.split()[0],
+                'platform':     platform.platform(),
+                'time':         time.strftime('%Y-%m-%dT%H:%M:%S')
+                }
+
+    #/************************************************************************/
+    def __urls(self, server, batch, size):
+        # fresh URLs, so that the uncached paths never hit a previous entry
+        urls = [server.url('data/%d' % (self.__nurl + i), size=size) for i in range(batch)]
+        self.__nurl += batch
+        return urls
+
+    #/************************************************************************/
+    @staticmethod
+    def __call(serv, method, urls, path, cache_store):
+        if method == 'get_status':
+            return serv.get_status(*urls)
+        elif method == 'read_url':
+            kwargs = {'ofmt': 'content', '_caching_': path == 'cached', 'cache_store': cache_store}
+        else:
+            kwargs = {'_caching_': path == 'cached', 'cache_store': cache_store,
+                      '_force_download_': path != 'cached'}
+        return getattr(serv, method)(*urls, **kwargs)
+
+    #/************************************************************************/
+    @staticmethod
+    def __errors(res):
+        if not isinstance(res, (list, tuple)):
+            res = [res,]
+        return sum([1 for r in res if isinstance(r, Exception) or r == -1])
+
+    #/************************************************************************/
+    @staticmethod
+    def supports(transport, path):
+        """Check whether a transport implements a given path.
+        """
+        if transport is None or path == 'cached':
+            return True
+        return online.Service.TRANSPORTS[transport].ASYNCHRONOUS is (path == 'async')
+
+    #/************************************************************************/
+    def measure(self, server, method, path, batch, size, transport=None):
+        """Time one configuration of the benchmark.
+
+            >>> record = bench.measure(server, method, path, batch, size, transport=None)
+        """
+        online.ASYNCIO_AVAILABLE = {'sync': False, 'async': True}.get(path, self.__asyncio)
+        cache_store = tempfile.mkdtemp(prefix='pydatutils-bench-')
+        serv = online.Service(cache_store=cache_store, transport=transport)
+        times, errors, requests = [], 0, 0
+        try:
+            for _ in range(self.repeat):
+                urls = self.__urls(server, batch, size)
+                if path == 'cached': # warm the cache first
+                    self.__call(serv, method, urls, path, cache_store)
+                nreq = server.requests
+                start = time.perf_counter()
+                try:
+                    res = self.__call(serv, method, urls, path, cache_store)
+                except Exception:
+                    errors += batch
+                else:
+                    errors += self.__errors(res)
+                times.append(time.perf_counter() - start)
+                requests += server.requests - nreq
+        finally:
+            shutil.rmtree(cache_store, ignore_errors=True)
+        mean = statistics.mean(times)
+        return {'method':       method,
+                'path':         path,
+                'transport':    transport,
+                'batch':        batch,
+                'size':         size,
+                'repeat':       self.repeat,
+                'times':        times,
+                'mean':         mean,
+                'median':       statistics.median(times),
+                'min':          min(times),
+                'per_url':      mean / batch,
+                'url_per_s':    batch / mean if mean > 0 else None,
+                'mb_per_s':     batch * size / mean / 1024**2 if mean > 0 else None,
+                'errors':       errors,
+                'requests':     requests,
+                'metrics':      getattr(serv, 'metrics', None)
+                }
+
+    #/************************************************************************/
+    def run(self, verbose=False):
+        """Run all the configurations of the benchmark.
+
+            >>> results = bench.run(verbose=False)
+
+        Returns
+        -------
+        results : dict
+            dictionary with the :data:`meta` description of the environment, the
+            :data:`config` of the stand-in server and the list of :data:`results`
+            of :meth:`~Bench.measure`.
+        """
+        results = []
+        try:
+            with LocalServer(**self.server_kwargs) as server:
+                for size in self.sizes:
+                    for method in self.methods:
+                        for path in self.paths:
+                            if method == 'get_status' and path == 'cached':
+                                continue # no caching of HEAD requests
+                            for transport in [t for t in self.transports if self.supports(t, path)]:
+                                for batch in self.batches:
+                                    record = self.measure(server, method, path, batch, size, transport)
+                                    if verbose is True:
+                                        print('%(method)-15s %(path)-7s %(transport)-8s batch=%(batch)-5d size=%(size)-9d'
+                                              ' mean=%(mean).4fs url/s=%(url_per_s).1f errors=%(errors)d'
+                                              % dict(record, transport=transport or '-'))
+                                    results.append(record)
+        finally:
+            online.ASYNCIO_AVAILABLE = self.__asyncio
+        return {'meta':     self.meta(),
+                'config':   dict(self.server_kwargs, repeat=self.repeat),
+                'results':  results}
+
+    #/************************************************************************/
+    @staticmethod
+    def dump(results, dest):
+        """Write the results of a benchmark run into a JSON file.
+
+            >>> Bench.dump(results, dest)
+        """
+        with open(dest, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    #/************************************************************************/
+    @staticmethod
+    def compare(old, new, key='median'):
+        """Compare the results of two benchmark runs, *e.g.* across versions.
+
+            >>> ratios = Bench.compare(old, new, key='median')
+
+        Arguments
+        ---------
+        old,new : str, dict
+            results (or JSON files of results) of :meth:`~Bench.run`.
+
+        Keyword arguments
+        -----------------
+        key : str
+            timing compared; default: :data:`key='median'`.
+
+        Returns
+        -------
+        ratios : list[dict]
+            for each configuration present in both runs, the ratio :data:`new/old`
+            of the timings: values below 1 denote a speed-up.
+        """
+        def _load(res):
+            if isinstance(res, str):
+                with open(res, 'r') as f:
+                    res = json.load(f)
+            return {(r['method'], r['path'], r.get('transport') or '', r['batch'], r['size']): r
+                    for r in res['results']}
+        old, new = _load(old), _load(new)
+        ratios = []
+        for conf in sorted(set(old.keys()).intersection(new.keys())):
+            method, path, transport, batch, size = conf
+            ratio = new[conf][key] / old[conf][key] if old[conf][key] > 0 else None
+            ratios.append({'method': method, 'path': path, 'transport': transport or None,
+                           'batch': batch, 'size': size,
+                           'old': old[conf][key], 'new': new[conf][key], 'ratio': ratio})
+        return ratios
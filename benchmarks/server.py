@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.. _server
+
+Module implementing a local HTTP stand-in used to benchmark the online layer.
+
+The server delivers synthetic payloads whose size, latency and error rate are
+set either for the whole server or per request through the query string, e.g.:
+
+    http://127.0.0.1:<port>/data/42?size=1024&latency=0.05&error=0.1&fmt=json
+
+Single byte ranges (:literal:`Range: bytes=first-last`) are honoured, unless
+:data:`ranges=0` is set.
+
+**Dependencies**
+
+*require*:      :mod:`http.server`, :mod:`threading`, :mod:`random`, :mod:`zipfile`
+
+**Contents**
+"""
+
+#%% Settings
+
+import io
+import json
+import time
+import random
+import threading
+import zipfile
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+
+PAYLOAD_FORMATS = ['json', 'bytes', 'text', 'zip']
+
+
+#%% Core functions/classes
+
+#==============================================================================
+# Class _Handler
+#==============================================================================
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler of the :class:`LocalServer` stand-in.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    #/************************************************************************/
+    def log_message(self, format, *args):
+        pass # keep the benchmark output quiet
+
+    #/************************************************************************/
+    def __parse(self):
+        config = self.server.config
+        query = parse_qs(urlsplit(self.path).query)
+        get = lambda key, typ: typ(query[key][0]) if key in query else config[key]
+        return {'size':     get('size', int),
+                'latency':  get('latency', float),
+                'error':    get('error', float),
+                'status':   get('status', int),
+                'fmt':      get('fmt', str),
+                'ranges':   get('ranges', lambda r: r not in ('0','false','False'))
+                }
+
+    #/************************************************************************/
+    def __range(self, length):
+        # parse a single byte range into (first, last), or None when absent
+        header = self.headers.get('Range', '')
+        if not header.startswith('bytes=') or ',' in header:
+            return None
+        first, last = header[len('bytes='):].split('-', 1)
+        if first == '': # suffix range
+            first, last = max(length - int(last), 0), length - 1
+        else:
+            first, last = int(first), min(int(last), length - 1) if last != '' else length - 1
+        return (first, last) if first <= last else None
+
+    #/************************************************************************/
+    def __respond(self, body=True):
+        param = self.__parse()
+        self.server.count()
+        if param['latency'] > 0:
+            time.sleep(param['latency'])
+        if self.server.draw() < param['error']:
+            status, content, ctype = param['status'], b'', 'text/plain'
+        else:
+            status = 200
+            content, ctype = self.server.payload(param['size'], param['fmt'])
+        crange = self.__range(len(content)) if status == 200 and param['ranges'] else None
+        if crange is not None:
+            status, length = 206, len(content)
+            content = content[crange[0]:crange[1]+1]
+        self.send_response(status)
+        self.send_header('Content-Type', ctype)
+        if param['ranges']:
+            self.send_header('Accept-Ranges', 'bytes')
+        if crange is not None:
+            self.send_header('Content-Range', 'bytes %d-%d/%d' % (crange[0], crange[1], length))
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        if body is True and content:
+            self.wfile.write(content)
+
+    #/************************************************************************/
+    def do_HEAD(self):
+        self.__respond(body=False)
+
+    #/************************************************************************/
+    def do_GET(self):
+        self.__respond(body=True)
+
+
+#==============================================================================
+# Class LocalServer
+#==============================================================================
+
+class LocalServer(ThreadingHTTPServer):
+    """Threaded local HTTP server delivering synthetic payloads.
+
+        >>> server = LocalServer(size=1024, latency=0., error=0., fmt='json')
+        >>> with server:
+        ...     url = server.url('data/1', size=2048)
+
+    Keyword arguments
+    -----------------
+    size : int
+        default size (in bytes) of the delivered payloads; default: :data:`size=1024`.
+    latency : float
+        default latency (in seconds) added before each response; default:
+        :data:`latency=0.`.
+    error : float
+        default rate (in :literal:`[0,1]`) of requests answered with an error
+        status; default: :data:`error=0.`.
+    status : int
+        status code returned for failed requests; default: :data:`status=503`.
+    fmt : str
+        default format of the payloads, any string in :data:`PAYLOAD_FORMATS`;
+        default: :data:`fmt='json'`.
+    ranges : bool
+        flag set to honour range requests; default: :data:`ranges=True`.
+    seed : int
+        seed of the random generator used to draw errors; default: :data:`seed=0`.
+    host,port :
+        address the server is bound to; default: :data:`host='127.0.0.1'` and
+        :data:`port=0`, *i.e.* any free port.
+    """
+
+    daemon_threads = True
+
+    #/************************************************************************/
+    def __init__(self, **kwargs):
+        host, port = kwargs.pop('host', '127.0.0.1'), kwargs.pop('port', 0)
+        self.config = {'size':      kwargs.pop('size', 1024),
+                       'latency':   kwargs.pop('latency', 0.),
+                       'error':     kwargs.pop('error', 0.),
+                       'status':    kwargs.pop('status', 503),
+                       'fmt':       kwargs.pop('fmt', 'json'),
+                       'ranges':    kwargs.pop('ranges', True)
+                       }
+        if self.config['fmt'] not in PAYLOAD_FORMATS:
+            raise IOError("Wrong value for FMT parameter - must be in %s" % PAYLOAD_FORMATS)
+        self.__random = random.Random(kwargs.pop('seed', 0))
+        self.__lock = threading.Lock()
+        self.__payloads = {}
+        self.__thread = None
+        self.requests = 0
+        super(LocalServer, self).__init__((host, port), _Handler)
+
+    #/************************************************************************/
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    #/************************************************************************/
+    @property
+    def address(self):
+        host, port = self.server_address[:2]
+        return 'http://%s:%s' % (host, port)
+
+    #/************************************************************************/
+    def url(self, path='', **kwargs):
+        """Build the URL of a resource delivered by the server.
+
+            >>> url = server.url(path='', **kwargs)
+        """
+        url = '%s/%s' % (self.address, path.lstrip('/'))
+        if kwargs != {}:
+            url = '%s?%s' % (url, '&'.join(['%s=%s' % (k, v) for (k, v) in kwargs.items()]))
+        return url
+
+    #/************************************************************************/
+    def start(self):
+        """Serve requests in a background (daemon) thread.
+        """
+        if self.__thread is None:
+            self.__thread = threading.Thread(target=self.serve_forever, daemon=True)
+            self.__thread.start()
+        return self
+
+    #/************************************************************************/
+    def stop(self):
+        """Shut the server down and release its socket.
+        """
+        if self.__thread is not None:
+            self.shutdown()
+            self.__thread.join()
+            self.__thread = None
+        self.server_close()
+
+    #/************************************************************************/
+    def handle_error(self, request, client_address):
+        pass # clients may drop a transfer midway, e.g. after probing ranges
+
+    #/************************************************************************/
+    def count(self):
+        with self.__lock:
+            self.requests += 1
+
+    #/************************************************************************/
+    def draw(self):
+        with self.__lock:
+            return self.__random.random()
+
+    #/************************************************************************/
+    def payload(self, size, fmt):
+        """Return the (memoised) content and type of a synthetic payload.
+
+            >>> content, ctype = server.payload(size, fmt)
+        """
+        key = (size, fmt)
+        with self.__lock:
+            if key not in self.__payloads:
+                self.__payloads[key] = self.__build_payload(size, fmt)
+            return self.__payloads[key]
+
+    #/************************************************************************/
+    @staticmethod
+    def __build_payload(size, fmt):
+        # build a payload of (approximately) size bytes in the given format
+        rand = random.Random(size)
+        if fmt == 'json':
+            nrec = max(size // 32, 1)
+            records = [{'id': i, 'value': round(rand.random(), 6)} for i in range(nrec)]
+            return json.dumps(records).encode('utf-8'), 'application/json'
+        elif fmt == 'text':
+            line = 'abcdefghijklmnopqrstuvwxyz0123456789,'
+            return (line * (size // len(line) + 1))[:size].encode('utf-8'), 'text/plain; charset=utf-8'
+        content = bytes(rand.getrandbits(8) for _ in range(size))
+        if fmt == 'bytes':
+            return content, 'application/octet-stream'
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr('data.bin', content)
+        return buffer.getvalue(), 'application/zip'
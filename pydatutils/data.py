@@ -407,19 +407,20 @@ class Frame(_Data):
             nkw = Struct.inspect_kwargs(kwargs, pd.to_excel)
             df.to_excel(d, **nkw)
         def _to_json(df, d, **kw):
-            nkw = Struct.inspect_kwargs(kwargs, Frame.to_json)
+            # e.g. columns goes to to_json, indent to json.dump
+            nkw, dkw = Struct.route_kwargs(kw, Frame.to_json, json.dump)
             res = cls.to_json(df, **nkw)
             with open(d, 'w', encoding=encoding) as f:
-                json.dump(res, f, ensure_ascii=False)
+                json.dump(res, f, **dict({'ensure_ascii': False}, **dkw))
         def _to_geojson(df, d, **kw):
             if _is_geojson_imported is True:
                 nkw = Struct.inspect_kwargs(kwargs, gpd.to_file)
                 df.to_file(d, driver='GeoJSON', **nkw)
             else:
-                nkw = Struct.inspect_kwargs(kwargs, Frame.to_json)
+                nkw, dkw = Struct.route_kwargs(kw, Frame.to_json, json.dump)
                 res = cls.to_json(df, **nkw)
                 with open(d, 'w', encoding=encoding) as f:
-                    json.dump(res, f, ensure_ascii=False)
+                    json.dump(res, f, **dict({'ensure_ascii': False}, **dkw))
         def _to_geopackage(df, d, **kw):
             nkw = Struct.inspect_kwargs(kwargs, gpd.to_file)
             df.to_file(d, driver='GPKG', **nkw)
@@ -435,7 +436,7 @@ class Frame(_Data):
             except:
                 warnings.warn("\n! Output file '%s' already exist - will be overwritten")
             try:
-                fundumps[f](dest, **kwargs)
+                fundumps[f](df, dest, **kwargs)
             except:
                 warnings.warn("\n! Impossible to write to %s !" % f.upper())
             else:
@@ -603,6 +604,10 @@ class Frame(_Data):
                     'xml':      _read_xml,
                     'table':    _read_table,
                     }
+        # sniff the source first, so that the guessed readers are tried first: the
+        # other candidates are still tried, in turn, when they fail (e.g. zipped CSV)
+        guess = File.sniff_format(src, fmt=ifmt) or []
+        ifmt = guess + [f for f in ifmt if f not in guess]
         for f in ifmt:
             try:
                 df = funloads[f](src, **kwargs)
@@ -742,6 +747,10 @@ class GeoFrame(_Data):
                     'shp':      _read_shapefile,
                     'gpkg':     _read_geopackage
                     }
+        # sniff the source first, so that the guessed readers are tried first: the
+        # other candidates are still tried, in turn, when they fail (e.g. zipped CSV)
+        guess = File.sniff_format(src, fmt=ifmt) or []
+        ifmt = guess + [f for f in ifmt if f not in guess]
         for f in ifmt:
             try:
                 df = funloads[f](src, **kwargs)
@@ -771,10 +780,10 @@ class GeoFrame(_Data):
                 nkw = Struct.inspect_kwargs(kwargs, gpd.to_file)
                 df.to_file(d, driver='GeoJSON', **nkw)
             else:
-                nkw = Struct.inspect_kwargs(kwargs, Frame.to_json)
+                nkw, dkw = Struct.route_kwargs(kw, Frame.to_json, json.dump)
                 res = Frame.to_json(df, **nkw)
                 with open(d, 'w', encoding=encoding) as f:
-                    json.dump(res, f, ensure_ascii=False)
+                    json.dump(res, f, **dict({'ensure_ascii': False}, **dkw))
         def _to_geopackage(df, d, **kw):
             nkw = Struct.inspect_kwargs(kwargs, gpd.to_file)
             df.to_file(d, driver='GPKG', **nkw)
@@ -787,7 +796,7 @@ class GeoFrame(_Data):
             except:
                 warnings.warn("\n! Output file '%s' already exist - will be overwritten")
             try:
-                fundumps[f](dest, **kwargs)
+                fundumps[f](df, dest, **kwargs)
             except:
                 warnings.warn("\n! Impossible to write to %s !" % f.upper())
             else:
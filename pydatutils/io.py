@@ -18,9 +18,11 @@ Module implementing miscenalleous Input/Output methods.
 **Dependencies**
 
 *require*:      :mod:`requests`, :mod:`zipfile`,
-                :mod:`hashlib`, :mod:`shutil`, :mod:`json`
+                :mod:`hashlib`, :mod:`shutil`, :mod:`json`, :mod:`itertools`, :mod:`mmap`,
+                :mod:`base64`, :mod:`gzip`, :mod:`bz2`, :mod:`lzma`, :mod:`tarfile`
 
-*optional*:     :mod:`bs4`, :mod:`chardet`, :mod:`xml.etree`
+*optional*:     :mod:`bs4`, :mod:`chardet`, :mod:`xml.etree`, :mod:`zstandard`,
+                :mod:`orjson`, :mod:`ujson`, :mod:`numpy`, :mod:`pandas`
 
 *call*:         :mod:`pydatutils.misc`, :mod:`pydatutils.struct`, :mod:`pydatutils.online`
 
@@ -32,7 +34,10 @@ Module implementing miscenalleous Input/Output methods.
 
 #%% Settings
 
-import io
+import io, os, sys
+import base64
+import uuid
+from functools import partial
 from os import path as osp
 from warnings import warn
 
@@ -40,7 +45,30 @@ from collections import OrderedDict
 from collections.abc import Mapping, Sequence
 from six import string_types
 
+import csv
 import zipfile
+import tarfile
+import gzip, bz2, lzma
+import itertools
+import mmap
+import shutil
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    _is_numpy_installed = False
+else:
+    _is_numpy_installed = True
+
+try:
+    import pandas as pd
+except ImportError:
+    _is_pandas_installed = False
+else:
+    _is_pandas_installed = True
 
 try:
     import simplejson as json
@@ -56,12 +84,33 @@ except ImportError:
                 with open(arg, 'r') as f:   return f.read()
             def loads(self,arg):            return '%s' % arg
 
+try:
+    import orjson
+except ImportError:
+    _is_orjson_installed = False
+else:
+    _is_orjson_installed = True
+
+try:
+    import ujson
+except ImportError:
+    _is_ujson_installed = False
+else:
+    _is_ujson_installed = True
+
 try:
     import chardet
 except ImportError:
     #warnings.warn('\n! missing chardet package (visit https://pypi.org/project/chardet/ !')
     pass
 
+try:
+    import zstandard
+except ImportError:
+    _is_zstandard_installed = False
+else:
+    _is_zstandard_installed = True
+
 try:
     import xml.etree.cElementTree as et
 except ImportError:
@@ -92,6 +141,40 @@ class File():
                         'sas':          'sas'
                         }
 
+    LINE_INDEX      = '.lidx.npy'   # suffix of the persisted line indexes
+
+    CHUNK_SIZE      = 2**20
+
+    UNZIP_WORKERS   = 1         # sequential extraction by default
+
+    ZERO_COPY       = False     # stored members read through copies by default
+
+    COMPRESSIONS    = { 'zip':          (b'PK\x03\x04', b'PK\x05\x06'),
+                        'gzip':         b'\x1f\x8b',
+                        'bz2':          b'BZh',
+                        'xz':           b'\xfd7zXZ\x00',
+                        'zstd':         b'\x28\xb5\x2f\xfd'
+                        }
+
+    SUFFIXES        = ['.gz', '.gzip', '.bz2', '.xz', '.zst', '.zstd']
+
+    SIGNATURES      = [ (b'PK\x03\x04',                        ['xls', 'shp']), # xlsx, or zipped
+                        (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1',    ['xls']),
+                        (b'SQLite format 3\x00',              ['gpkg', 'sql']),
+                        (b'\x00\x00\x27\x0a',                  ['shp']),
+                        (b'HEADER RECORD*******LIBRARY',     ['sas']), # xport
+                        (b'\x00' * 12 + b'\xc2\xea\x81\x60',    ['sas'])  # sas7bdat
+                        ]
+
+    BOMS            = [ (b'\xef\xbb\xbf',                      'utf-8'),
+                        (b'\xff\xfe\x00\x00',                  'utf-32-le'),
+                        (b'\x00\x00\xfe\xff',                  'utf-32-be'),
+                        (b'\xff\xfe',                          'utf-16-le'),
+                        (b'\xfe\xff',                          'utf-16-be')
+                        ]
+
+    SNIFF_SIZE      = 2**12
+
     #/************************************************************************/
     @staticmethod
     def check_format(fmt, infer_fmt=False):
@@ -129,12 +212,191 @@ class File():
 
     #/****************************************************************************/
     @staticmethod
-    def pick_lines(file, rows):
+    def __pick_rows(rows):
+        # normalise rows into a range or a sorted list of (unique) line numbers
+        if isinstance(rows, slice):
+            rows = range(rows.start or 0, sys.maxsize if rows.stop is None else rows.stop, rows.step or 1)
+        elif isinstance(rows, int):
+            rows = [rows,]
+        if isinstance(rows, range) and rows.step > 0:
+            return rows if rows.start >= 0 else range(rows.start % rows.step, rows.stop, rows.step)
+        return sorted(set([r for r in rows if r >= 0]))
+
+    #/****************************************************************************/
+    @staticmethod
+    def pick_lines(file, rows, index=None):
         """Pick numbered lines from file.
 
-            >>> lines = File.pick_lines(file, rows)
+            >>> lines = File.pick_lines(file, rows, index=None)
+
+        Arguments
+        ---------
+        file : str, file
+            (name of) the file, or any iterable over its lines, opened in either
+            binary or text mode; a filename is opened in text mode.
+        rows : int, list[int], range, slice
+            (0-based) numbers of the lines to pick.
+
+        Keyword arguments
+        -----------------
+        index : bool, Sequence[int]
+            offsets of the lines in the file (see :meth:`~File.line_index`), or
+            :data:`True` to load (or build) the index persisted alongside the file,
+            so that the picked lines are reached by seeking; default:
+            :data:`index=None`, *i.e.* the file is streamed.
+
+        Returns
+        -------
+        lines : list
+            lines of the file, in the order of the file: the file is read until
+            the last picked line only.
+        """
+        rows = File.__pick_rows(rows)
+        if len(rows) == 0:
+            return []
+        if isinstance(file, string_types):
+            with open(file, 'r') as f:
+                return File.pick_lines(f, rows, index=index)
+        if index is True:
+            try:
+                index = File.line_index(file.name)
+            except:
+                raise IOError("Impossible to index lines of file '%s'" % getattr(file, 'name', file))
+            with index:
+                return File.pick_lines(file, rows, index=index)
+        lines, last = [], None
+        if index not in (None, False):
+            for r in rows:
+                if r >= len(index):
+                    break
+                elif last is None or r != last + 1: # seek unless reading on
+                    file.seek(index[r])
+                lines.append(file.readline())
+                last = r
+            return lines
+        file, pos = iter(file), 0
+        if isinstance(rows, range) and rows.step == 1:
+            return list(itertools.islice(file, rows.start, rows.stop))
+        for r in rows:
+            line = next(itertools.islice(file, r - pos, None), None)
+            if line is None:
+                break
+            lines.append(line)
+            pos = r + 1
+        return lines
+
+    #/****************************************************************************/
+    @staticmethod
+    def line_index(file, store=True):
+        """Index the offsets of the lines in a file.
+
+            >>> index = File.line_index(file, store=True)
+
+        See :class:`LineIndex`.
         """
-        return [x for i, x in enumerate(file) if i in rows]
+        return LineIndex(file, store=store)
+
+    #/************************************************************************/
+    @staticmethod
+    def __name_index(namelist):
+        # map all the trailing paths of the members onto their full names
+        index = {}
+        for name in namelist:
+            parts = name.rstrip('/').split('/')
+            for k in range(len(parts)):
+                index.setdefault('/'.join(parts[k:]), []).append(name)
+        return index
+
+    #/************************************************************************/
+    @staticmethod
+    def __extract_member(zf, member, path, pwd=None):
+        # extract a member by chunks, sanitising its path the way zipfile does
+        info = member if isinstance(member, zipfile.ZipInfo) else zf.getinfo(member)
+        arcname = osp.splitdrive(info.filename.replace('/', os.sep))[1]
+        arcname = os.sep.join([x for x in arcname.split(os.sep) if x not in ('', os.curdir, os.pardir)])
+        dest = osp.normpath(osp.join(path, arcname))
+        if info.is_dir():
+            os.makedirs(dest, exist_ok=True)
+            return dest
+        os.makedirs(osp.dirname(dest), exist_ok=True)
+        with zf.open(info, pwd=pwd) as src, open(dest, 'wb') as dst:
+            shutil.copyfileobj(src, dst, File.CHUNK_SIZE)
+        return dest
+
+    #/************************************************************************/
+    @staticmethod
+    def __unzip_parallel(file, operator, members, workers, path=None, pwd=None):
+        # run an operation over the members in a pool of threads, each thread
+        # holding its own handle on the archive
+        local, handles = threading.local(), []
+        def task(member):
+            if getattr(local, 'zf', None) is None:
+                local.zf = zipfile.ZipFile(file)
+                handles.append(local.zf)
+            if operator == 'read':
+                return local.zf.read(member, pwd=pwd)
+            return File.__extract_member(local.zf, member, path, pwd=pwd)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(task, members))
+        finally:
+            [zf.close() for zf in handles]
+        return dict(zip(members, results))
+
+    #/************************************************************************/
+    @staticmethod
+    def __map_archive(file):
+        # map an archive on disk, or opened from disk, into memory
+        try:
+            if isinstance(file, string_types):
+                with open(file, 'rb') as f:
+                    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, IOError, OSError, ValueError, io.UnsupportedOperation):
+            return None
+
+    #/************************************************************************/
+    @staticmethod
+    def __member_offset(mm, info):
+        # offset of the data of a member that is stored (neither compressed,
+        # nor encrypted) in a mapped archive, None otherwise
+        if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+            return None
+        start = info.header_offset
+        header = struct.unpack(zipfile.structFileHeader, mm[start:start + zipfile.sizeFileHeader])
+        if header[0] != zipfile.stringFileHeader:
+            raise IOError("Bad local header of member '%s' in zip source" % info.filename)
+        # the local header is followed by the file name (10) and extra field (11)
+        return start + zipfile.sizeFileHeader + header[10] + header[11]
+
+    #/************************************************************************/
+    @staticmethod
+    def map_member(file, member):
+        """Map the data of a member stored uncompressed in a zip archive.
+
+            >>> view = File.map_member(file, member)
+
+        Arguments
+        ---------
+        file : str, file
+            (name of) the zip archive, stored on disk.
+        member : str, zipfile.ZipInfo
+            name or info of the member in the archive.
+
+        Returns
+        -------
+        view : memoryview
+            zero-copy view over the bytes of the member in the memory-mapped archive,
+            or :data:`None` when the member is compressed or encrypted, or when the
+            archive cannot be mapped.
+        """
+        mm = File.__map_archive(file)
+        if mm is None:
+            return None
+        with zipfile.ZipFile(file) as zf:
+            info = member if isinstance(member, zipfile.ZipInfo) else zf.getinfo(member)
+        offset = File.__member_offset(mm, info)
+        return None if offset is None else memoryview(mm)[offset:offset + info.file_size]
 
     #/************************************************************************/
     @staticmethod
@@ -142,6 +404,19 @@ class File():
         """Unzip file on-disk.
 
             >>> res = File.unzip(file, **kwargs)
+
+        Note
+        ----
+        With :data:`workers` (default: :data:`UNZIP_WORKERS`) greater than 1, the
+        members of an archive stored on disk are extracted (or read) by a pool of
+        threads, each opening its own handle on the archive, and copied on-disk by
+        chunks of :data:`CHUNK_SIZE` bytes.
+
+        With :data:`zero_copy` (default: :data:`ZERO_COPY`) set to :data:`True`, the
+        members stored uncompressed in an archive on disk are not copied: the
+        archive is memory-mapped and :literal:`read` returns a :class:`memoryview`
+        over the bytes of the member, while :literal:`open` returns a read-only
+        stream over this view (see :meth:`~File.map_member`).
         """
         # try:
         #     assert isinstance(file, (io.BytesIO,string_types))
@@ -152,6 +427,8 @@ class File():
         except:
             raise IOError("Zip file '%s' not recognised" % file)
         path = kwargs.pop('path') if 'path' in kwargs else SysEnv.default_cache()
+        workers = kwargs.pop('workers', None) or File.UNZIP_WORKERS
+        zero_copy = kwargs.pop('zero_copy', File.ZERO_COPY)
         operators = [op for op in ['open', 'extract', 'extractall', 'getinfo', 'namelist', 'read', 'infolist'] \
                      if op in kwargs.keys()]
         try:
@@ -174,6 +451,10 @@ class File():
         #    warn("\n! Data extracted from zip file will be physically stored on local disk !")
         if isinstance(members, string_types):
             members = [members,]
+        elif members not in (None, True):
+            members = list(members)
+        # only archives on disk can be opened by several threads at once
+        parallel = workers > 1 and isinstance(file, string_types) and operator in ('extract', 'extractall', 'read')
         with zipfile.ZipFile(file) as zf:
             namelist, infolist = zf.namelist(), zf.infolist()
             if operator == 'namelist':
@@ -182,38 +463,459 @@ class File():
                 return infolist if len(infolist) > 1 else infolist[0]
             elif operator == 'extractall':
                 if members in (None, True):     members = namelist
-                return zf.extractall(path=path, members=members)
+                if parallel is False:
+                    return zf.extractall(path=path, members=members)
+                File.__unzip_parallel(file, 'extract', members, workers, path=path, pwd=kwargs.get('pwd'))
+                return None
             if members is None and len(namelist) == 1:
                 members = namelist
             elif members is not None:
+                names, index = set(namelist), File.__name_index(namelist)
                 for i in reversed(range(len(members))):
                     m = members[i]
-                    try:
-                        assert m in namelist
-                    except:
-                        try:
-                            _mem = [n for n in namelist if n.endswith(m)]
-                            assert len(_mem) == 1
-                        except:
-                            if len(_mem) > 1:
-                                warn("\n! Mulitple files machting in zip source - ambiguity not resolved !" % m)
-                            else: # len(_mem) == 0 <=> _mem = []
-                                warn("\n! File '%s' not found in zip source !" % m)
-                            members.pop(i)
-                        else:
-                            members[i] = _mem[0]
-                    else:
-                        pass # continue
+                    if m in names:
+                        continue
+                    _mem = index.get(m) or [n for n in namelist if n.endswith(m)]
+                    if len(_mem) == 1:
+                        members[i] = _mem[0]
+                        continue
+                    elif len(_mem) > 1:
+                        warn("\n! Mulitple files machting '%s' in zip source - ambiguity not resolved !" % m)
+                    else: # len(_mem) == 0 <=> _mem = []
+                        warn("\n! File '%s' not found in zip source !" % m)
+                    members.pop(i)
             # now: operator in ('extract', 'getinfo', 'read')
             if members in ([], None):
                 raise IOError("Impossible to retrieve member file(s) from zipped data")
+            mm = None
+            if zero_copy is True and operator in ('read', 'open') and kwargs.get('pwd') is None:
+                mm = File.__map_archive(file)
+            if parallel is True and mm is None:
+                return File.__unzip_parallel(file, operator, members, workers, path=path, pwd=kwargs.get('pwd'))
             nkw = Struct.inspect_kwargs(kwargs, getattr(zf, operator))
             if operator == 'extract':
                 nkw.update({'path': path})
-            results = {m: getattr(zf, operator)(m, **nkw) for m in members}
+            results = {}
+            for m in members:
+                info = zf.getinfo(m)
+                offset = None if mm is None or nkw.get('mode','r') != 'r' else File.__member_offset(mm, info)
+                if offset is None:
+                    results[m] = getattr(zf, operator)(m, **nkw)
+                elif operator == 'read':
+                    results[m] = memoryview(mm)[offset:offset + info.file_size]
+                else:
+                    results[m] = _MemberStream(mm, offset, info.file_size, name=m)
         return results
         # raise IOError("Operation '%s' failed" % operator)
 
+    #/************************************************************************/
+    @staticmethod
+    def __head(file, size=512):
+        # read the first bytes of a file without moving its cursor
+        if isinstance(file, string_types):
+            with open(file, 'rb') as f:
+                return f.read(size)
+        elif isinstance(file, (bytes, bytearray, memoryview)):
+            return bytes(file[:size])
+        elif isinstance(file, io.BufferedReader):
+            return file.peek(size)[:size]
+        try:
+            pos = file.tell()
+            head = file.read(size)
+            file.seek(pos)
+        except (AttributeError, IOError, OSError, ValueError, io.UnsupportedOperation):
+            return b''
+        return head if isinstance(head, bytes) else b''
+
+    #/************************************************************************/
+    @staticmethod
+    def sniff_compression(file):
+        """Identify the compression (or archive) format of a file from its magic bytes.
+
+            >>> codec = File.sniff_compression(file)
+
+        Arguments
+        ---------
+        file : str, bytes, file
+            (name of) a file, or its content.
+
+        Returns
+        -------
+        codec : str
+            any key of :data:`COMPRESSIONS`, :literal:`'tar'` for (uncompressed)
+            tar archives, or :data:`None` when the file is not compressed.
+        """
+        head = File.__head(file)
+        for codec, magic in File.COMPRESSIONS.items():
+            if head.startswith(magic):
+                return codec
+        return 'tar' if head[257:262] == b'ustar' else None
+
+    #/************************************************************************/
+    @staticmethod
+    def sniff_format(src, fmt=None):
+        """Guess the format of some data from their first bytes.
+
+            >>> guess = File.sniff_format(src, fmt=None)
+
+        Arguments
+        ---------
+        src : str, bytes, file
+            (name of) a file, or its content.
+
+        Keyword arguments
+        -----------------
+        fmt : list[str]
+            candidate formats the guess is restricted to; default: :data:`fmt=None`.
+
+        Returns
+        -------
+        guess : list[str]
+            formats the data may be in, ranked from the most likely one, or :data:`[]`
+            when nothing is recognised (*e.g.*, when a string is not the name of
+            a file).
+
+        Note
+        ----
+        The first :data:`SNIFF_SIZE` bytes only are inspected: binary formats are
+        identified from their magic bytes (see :data:`SIGNATURES`), text formats
+        from their BOM (see :data:`BOMS`) and JSON/XML/HTML signatures, and
+        delimited tables from their delimiter.
+        """
+        if isinstance(src, string_types) and not osp.isfile(src):
+            return [] # URL, raw content...
+        head = File.__head(src, File.SNIFF_SIZE)
+        guess = []
+        for magic, formats in File.SIGNATURES:
+            if head.startswith(magic):
+                guess = formats
+                break
+        if guess == [] and head != b'' and File.sniff_compression(head) is None:
+            encoding = 'utf-8'
+            for bom, enc in File.BOMS:
+                if head.startswith(bom):
+                    head, encoding = head[len(bom):], enc
+                    break
+            text = head.decode(encoding, errors='ignore').lstrip()
+            lower = text[:512].lower()
+            if '\x00' in text: # binary
+                pass
+            elif text.startswith(('{', '[')):
+                if '"topology"' in lower:
+                    guess = ['topojson', 'geojson', 'json']
+                elif '"feature' in lower:
+                    guess = ['geojson', 'topojson', 'json']
+                else:
+                    guess = ['json']
+            elif text.startswith('<'):
+                if lower.startswith(('<!doctype html', '<html', '<table')) or '<html' in lower:
+                    guess = ['html', 'htmltab', 'xml']
+                else:
+                    guess = ['xml', 'html', 'htmltab']
+            else: # delimited table, ignoring a truncated last line
+                sample = text.rsplit('\n', 1)[0] if len(head) == File.SNIFF_SIZE else text
+                try:
+                    delimiter = csv.Sniffer().sniff(sample, delimiters=',;\t|').delimiter
+                except csv.Error:
+                    delimiter = None
+                guess = ['table', 'csv'] if delimiter == '\t' else ['csv', 'table']
+        if fmt is not None:
+            guess = [f for f in guess if f in fmt]
+        return guess
+
+    #/************************************************************************/
+    @staticmethod
+    def __open_codec(file, codec):
+        # open a decompressed stream over a single-stream compressed file
+        if isinstance(file, (bytes, bytearray, memoryview)):
+            file = io.BytesIO(file)
+        if codec == 'gzip':
+            return gzip.open(file, 'rb')
+        elif codec == 'bz2':
+            return bz2.open(file, 'rb')
+        elif codec == 'xz':
+            return lzma.open(file, 'rb')
+        elif codec == 'zstd':
+            if _is_zstandard_installed is False:
+                raise IOError("Module zstandard required to decompress file '%s'" % file)
+            closefd = isinstance(file, string_types)
+            if closefd:
+                file = open(file, 'rb')
+            return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(file, closefd=closefd),
+                                     buffer_size=File.CHUNK_SIZE)
+        elif isinstance(file, string_types): # 'tar'
+            return open(file, 'rb')
+        return file
+
+    #/************************************************************************/
+    @staticmethod
+    def decompress(file, member=None, path=None):
+        """Open the content of a compressed file (gzip, bz2, xz or zstd), or of a
+        (compressed) tar archive, as decompressed streams.
+
+            >>> res = File.decompress(file, member=None, path=None)
+
+        Arguments
+        ---------
+        file : str, bytes, file
+            (name of) the compressed file, or its content.
+
+        Keyword arguments
+        -----------------
+        member : str, list[str]
+            name(s) of the member(s) to open in a tar archive, matched on the
+            trailing part of their path; default: :data:`member=None`, *i.e.* all
+            files in the archive.
+        path : str
+            when set, the data are decompressed (by chunks) into this directory
+            instead of being streamed; default: :data:`path=None`.
+
+        Returns
+        -------
+        res : dict
+            dictionary mapping the name of the decompressed file(s), *e.g.* the name
+            of a gzip file without its suffix, onto a read-only stream, or onto the
+            path of the decompressed file when :data:`path` is set.
+
+        Note
+        ----
+        The compression is identified from the magic bytes of the file (see
+        :meth:`~File.sniff_compression`), not from its suffix. Streams are not
+        rewound: data are decompressed as they are read.
+        """
+        codec = File.sniff_compression(file)
+        try:
+            assert codec not in (None, 'zip')
+        except:
+            raise IOError("File '%s' not recognised as a compressed stream" % file)
+        stream = File.__open_codec(file, codec)
+        if isinstance(stream, io.BufferedReader):
+            head = stream.peek(512)[:512]
+        else:
+            head = stream.read(512)
+            stream.seek(0)
+        if isinstance(member, string_types):
+            member = [member,]
+        if head[257:262] != b'ustar': # single stream
+            name = osp.basename(file) if isinstance(file, string_types) else getattr(file, 'name', None)
+            if isinstance(name, string_types) and osp.splitext(name)[-1].lower() in File.SUFFIXES:
+                name = osp.splitext(name)[0]
+            if path is None:
+                return {name: stream}
+            dest = osp.join(path, name or 'data')
+            os.makedirs(path, exist_ok=True)
+            with stream, open(dest, 'wb') as f:
+                shutil.copyfileobj(stream, f, File.CHUNK_SIZE)
+            return {name: dest}
+        # streams which cannot seek, e.g. zstd, are read in the order of the archive
+        seekable = stream.seekable()
+        tf = tarfile.open(fileobj=stream, mode='r:' if seekable else 'r|')
+        wanted = lambda name: member in (None, []) \
+            or any([name == m or name.endswith('/' + m) for m in member])
+        nkw = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+        results = {}
+        for info in tf:
+            if not (info.isfile() and wanted(info.name)):
+                continue
+            elif path is not None:
+                tf.extract(info, path=path, **nkw)
+                results[info.name] = osp.join(path, info.name)
+            elif seekable:
+                results[info.name] = tf.extractfile(info)
+            else:
+                results[info.name] = io.BytesIO(tf.extractfile(info).read())
+        for m in member or []:
+            if not any([n == m or n.endswith('/' + m) for n in results]):
+                warn("\n! File '%s' not found in tar source !" % m)
+        if results == {}:
+            raise IOError("Impossible to retrieve member file(s) from tar data")
+        return results
+
+
+#==============================================================================
+# Class _MemberStream
+#==============================================================================
+
+class _MemberStream(io.RawIOBase):
+    """Read-only stream over the data of a member stored uncompressed in a memory-mapped
+    zip archive.
+
+        >>> stream = _MemberStream(mm, offset, size, name=None)
+        >>> view = stream.getbuffer()
+    """
+
+    def __init__(self, mm, offset, size, name=None):
+        self.__mm, self.__start, self.__end = mm, offset, offset + size
+        self.__pos = offset
+        self.name = name
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def getbuffer(self):
+        """Zero-copy view over the whole data of the member.
+        """
+        return memoryview(self.__mm)[self.__start:self.__end]
+
+    def tell(self):
+        return self.__pos - self.__start
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = {io.SEEK_SET: self.__start, io.SEEK_CUR: self.__pos, io.SEEK_END: self.__end}[whence]
+        self.__pos = min(max(base + offset, self.__start), self.__end)
+        return self.tell()
+
+    def readinto(self, b):
+        n = max(min(len(b), self.__end - self.__pos), 0)
+        b[:n] = memoryview(self.__mm)[self.__pos:self.__pos + n]
+        self.__pos += n
+        return n
+
+    def read(self, size=-1):
+        end = self.__end if size is None or size < 0 else min(self.__pos + size, self.__end)
+        data, self.__pos = self.__mm[self.__pos:end], max(end, self.__pos)
+        return data
+
+    def readline(self, size=-1):
+        end = self.__mm.find(b'\n', self.__pos, self.__end)
+        end = self.__end if end < 0 else end + 1
+        if size is not None and size >= 0:
+            end = min(end, self.__pos + size)
+        return self.read(end - self.__pos)
+
+
+#==============================================================================
+# Class LineIndex
+#==============================================================================
+
+class LineIndex():
+    """Index of the offsets of the lines in a (memory-mapped) file, providing
+    random access to its rows.
+
+        >>> index = LineIndex(file, store=True)
+        >>> rows = index.get_rows([10, 2, 1000])
+        >>> for row in index.iter_range(10, 20):
+        ...     pass
+
+    Arguments
+    ---------
+    file : str
+        name of the file to index.
+
+    Keyword arguments
+    -----------------
+    store : bool
+        flag set to persist the offsets alongside the file (as a :literal:`.npy`
+        file with suffix :data:`File.LINE_INDEX`), and reuse them as long as the
+        size and the modification time of the file are unchanged; default:
+        :data:`store=True`.
+
+    Note
+    ----
+    Newlines are searched with :mod:`numpy` over chunks of :data:`File.CHUNK_SIZE`
+    bytes of the mapped file, so that the memory used is bounded. Rows are returned
+    as (undecoded) :data:`bytes`, including their trailing newline.
+    """
+
+    #/************************************************************************/
+    def __init__(self, file, store=True):
+        if _is_numpy_installed is False:
+            raise IOError("Module numpy required to index the lines of file '%s'" % file)
+        self.file = file
+        stat = os.stat(file)
+        self.size = stat.st_size
+        self.__mm = None
+        if self.size > 0: # empty files cannot be mapped
+            with open(file, 'rb') as f:
+                self.__mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+        dest = file + File.LINE_INDEX
+        self.offsets = None
+        if store is True and osp.exists(dest):
+            try:
+                index = np.load(dest, mmap_mode='r')
+                assert np.array_equal(index[:2], header)
+            except:
+                pass # outdated or corrupted: rebuilt below
+            else:
+                self.offsets = index[2:]
+        if self.offsets is None:
+            self.offsets = self.__build()
+            if store is True:
+                try:
+                    np.save(dest, np.concatenate([header, self.offsets]))
+                except IOError:
+                    warn("\n! Line index of file '%s' not persisted !" % file)
+        self.__ends = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, row):
+        return self.offsets[row]
+
+    #/************************************************************************/
+    def __build(self):
+        # search the newlines chunk by chunk
+        offsets = [np.zeros(1, dtype=np.int64)]
+        for start in range(0, self.size, File.CHUNK_SIZE):
+            chunk = np.frombuffer(self.__mm, dtype=np.uint8,
+                                  count=min(File.CHUNK_SIZE, self.size - start), offset=start)
+            offsets.append(np.flatnonzero(chunk == 0x0A).astype(np.int64) + (start + 1))
+            del chunk # release the export of the mapping
+        offsets = np.concatenate(offsets)
+        if self.size == 0 or offsets[-1] == self.size: # no line after the last newline
+            offsets = offsets[:-1]
+        return offsets
+
+    #/************************************************************************/
+    @property
+    def ends(self):
+        """Offsets of the end of each line in the file.
+        """
+        if self.__ends is None:
+            self.__ends = np.append(self.offsets[1:], self.size).astype(np.int64)
+        return self.__ends
+
+    #/************************************************************************/
+    def get_rows(self, indices):
+        """Retrieve rows of the file, in the order of their indices.
+
+            >>> rows = index.get_rows(indices)
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        try:
+            starts, ends = self.offsets[indices].tolist(), self.ends[indices].tolist()
+        except IndexError:
+            raise IOError("Rows out of range of file '%s'" % self.file)
+        return [self.__mm[s:e] for s, e in zip(starts, ends)]
+
+    #/************************************************************************/
+    def iter_range(self, start=0, stop=None):
+        """Iterate over the rows of the file in the range [:data:`start`, :data:`stop`).
+
+            >>> for row in index.iter_range(start=0, stop=None):
+            ...     pass
+        """
+        start, stop, _ = slice(start, stop).indices(len(self.offsets))
+        for s, e in zip(self.offsets[start:stop].tolist(), self.ends[start:stop].tolist()):
+            yield self.__mm[s:e]
+
+    #/************************************************************************/
+    def close(self):
+        if self.__mm is not None:
+            self.__mm.close()
+            self.__mm = None
+
 
 #==============================================================================
 # Class Buffer
@@ -248,13 +950,19 @@ class Buffer():
             raise TypeError("Wrong type for data source parameter '%s' - must be a string" % src)
         if src is None:
             src, file = file, None
-        if zipfile.is_zipfile(src) or any([src.endswith(p) for p in ['zip', 'gz', 'gzip', 'bz2'] ]):
+        codec = File.sniff_compression(src) if osp.exists(src) else None
+        if codec == 'zip' or zipfile.is_zipfile(src):
             try:
                 # file = File.unzip(content, namelist=True)
                 kwargs.update({'open': file}) # when file=None, will read a single file
                 results = File.unzip(src, **kwargs)
             except:
                 raise IOError("Impossible unzipping content from zipped file '%s'" % src)
+        elif codec is not None:
+            try:
+                results = File.decompress(src, member=file)
+            except:
+                raise IOError("Impossible decompressing content from file '%s'" % src)
         else:
             results = {src: file}
         return results if len(results.keys())>1 else list(results.values())[0]
@@ -276,11 +984,21 @@ class Buffer():
             raise TypeError("Wrong type for data source parameter '%s' - must be a string" % src)
         if src is None:
             src, file = file, None
+        remote = None
         if any([src.startswith(p) for p in ['http', 'https', 'ftp'] ]):
-            try:
-                content = cls.from_url(src, **kwargs)
-            except:
-                raise IOError("Wrong request for data source from URL '%s'" % src)
+            # read the members of a remote archive through range requests, so
+            # that only the central directory and the members are transferred
+            if src.endswith('zip'):
+                try:
+                    remote = Requests.open_range(src, timeout=kwargs.get('timeout'))
+                except:
+                    raise IOError("Wrong request for data source from URL '%s'" % src)
+            content = remote
+            if content is None:
+                try:
+                    content = cls.from_url(src, **kwargs)
+                except:
+                    raise IOError("Wrong request for data source from URL '%s'" % src)
         else:
             try:
                 assert osp.exists(src) is True
@@ -294,16 +1012,35 @@ class Buffer():
             # path = kwargs.pop('store') if 'store' in kwargs else File.default_cache()
             path = kwargs.pop('store',None) or SysEnv.default_cache()
             kwargs.update({'extract': file, 'path': path})
+        elif remote is not None:
+            # members opened over range requests would outlive the connection:
+            # they are read at once instead
+            kwargs.update({'read': file})
         else:
             kwargs.update({'open': file}) # when file=None, will read a single file
-        if zipfile.is_zipfile(content) or any([src.endswith(p) for p in ['zip', 'gz', 'gzip', 'bz2'] ]):
-            try:
-                # file = File.unzip(content, namelist=True)
-                results = File.unzip(content, **kwargs)
-            except:
-                raise IOError("Impossible unzipping content from zipped file '%s'" % src)
-        else:
-            results = {file: content}
+        try:
+            # the container is identified from its magic bytes, not from its suffix
+            codec = File.sniff_compression(content)
+            if codec == 'zip' or (codec is None and zipfile.is_zipfile(content)):
+                try:
+                    # file = File.unzip(content, namelist=True)
+                    results = File.unzip(content, **kwargs)
+                except:
+                    raise IOError("Impossible unzipping content from zipped file '%s'" % src)
+                if 'read' in kwargs:
+                    results = {f: io.BytesIO(bytes(v)) for f, v in results.items()}
+            elif codec is not None:
+                try:
+                    results = File.decompress(content, member=file, path=kwargs.get('path') if 'extract' in kwargs else None)
+                except:
+                    raise IOError("Impossible decompressing content from file '%s'" % src)
+                if results.get(None) is not None and isinstance(src, string_types):
+                    results = {osp.splitext(osp.basename(src))[0]: results.pop(None)}
+            else:
+                results = {file: content}
+        finally:
+            if remote is not None:
+                remote.close() # also closes the session of the range requests
         # with 'extract', the normalised path to the file is returned
         #if kwargs.get('on_disk',False) is True:
         #    [results.update({f: osp.join(p,f)}) for f,p in results.items()]
@@ -316,80 +1053,404 @@ class Buffer():
 
 class Json():
 
+    # fast backends ('orjson' or 'ujson') are opt-in: they differ from json on
+    # NaN/infinity, integers beyond 64 bits and the separators of the output;
+    # orjson also encodes UUID, dataclass and enum values (rejected by json) and
+    # rejects the NaN/Infinity literals on load (accepted by json)
+    BACKEND         = None
+
+    SCALARS         = (type(None), bool, int, float, str)
+
+    NDJSON_BATCH    = 1000  # number of records written at once
+
+    SIDECAR_SIZE    = 2**20 # size of the arrays saved as .npy files, when allowed
+
+    TAG             = '__pydatutils__' # key marking the encoded arrays and pandas objects
+
     #/************************************************************************/
     @classmethod
-    def serialize(cls, data):
-        """
+    def serialize(cls, data, sidecar=None):
+        """Tag the tuples, sets, ordered and non-string keyed dictionaries, as well
+        as the :mod:`numpy` arrays and :mod:`pandas` objects, of some data so that
+        their types are preserved through JSON, see :meth:`~Json.restore`.
+
+            >>> res = Json.serialize(data, sidecar=None)
+
+        Keyword arguments
+        -----------------
+        sidecar : str
+            directory where the arrays of :data:`SIDECAR_SIZE` bytes or more are saved
+            as :literal:`.npy` files (referred to by their name in the directory),
+            instead of being encoded; default: :data:`sidecar=None`, *i.e.* all arrays
+            are encoded.
+
+        Note
+        ----
+        Nested containers are walked iteratively (with an explicit stack), so that
+        deep structures do not hit the recursion limit. Arrays are encoded as their
+        raw buffer in base64, tagged with their dtype and shape; dataframes are
+        encoded column-wise. Encoded objects are marked with the key :data:`TAG`,
+        so that ordinary dictionaries are never decoded by :meth:`~Json.restore`.
         """
-        if data is None or isinstance(data, (type, bool, int, float, str)):
-            return data
-        elif isinstance(data, Sequence):
-            if isinstance(data, list):          return [cls.serialize(val) for val in data]
-            elif isinstance(data, tuple):       return {"tup": [cls.serialize(val) for val in data]}
-        elif isinstance(data, Mapping):
-            if isinstance(data, OrderedDict):   return {"odic": [[cls.serialize(k), cls.serialize(v)] for k, v in data.items()]}
-            elif isinstance(data, dict):
-                if all(isinstance(k, str) for k in data):
-                    return {k: cls.serialize(v) for k, v in data.items()}
-                return {"dic": [[cls.serialize(k), cls.serialize(v)] for k, v in data.items()]}
-        elif isinstance(data, set):             return {"set": [cls.serialize(val) for val in data]}
-        raise TypeError("Type %s not data-serializable" % type(data))
+        scalars = cls.SCALARS
+        root = [None]
+        # stack of (data, parent container, key in the parent); a container is
+        # active (i.e. an ancestor of the data being walked) until its exit
+        # marker, stacked below its items, is popped
+        stack, active, exit = [(data, root, 0)], set(), object()
+        def push(items, res):
+            for (k, v) in items:
+                if type(v) in scalars:
+                    res[k] = v # shortcut: not stacked
+                else:
+                    stack.append((v, res, k))
+        def enter(data):
+            if id(data) in active:
+                raise ValueError("Circular reference detected")
+            active.add(id(data))
+            stack.append((id(data), exit, None))
+        while stack:
+            data, parent, key = stack.pop()
+            if parent is exit:
+                active.discard(data)
+                continue
+            typ = type(data)
+            if typ in scalars or isinstance(data, (type, bool, int, float, str)):
+                parent[key] = data
+                continue
+            if typ is list or typ is tuple or isinstance(data, (list, tuple, set)):
+                enter(data)
+                res = [None] * len(data)
+                parent[key] = res if isinstance(data, list) else {"tup" if isinstance(data, tuple) else "set": res}
+                push(enumerate(data), res)
+            elif _is_numpy_installed and isinstance(data, np.generic):
+                parent[key] = data.item()
+            elif _is_numpy_installed and isinstance(data, np.ndarray) \
+                    or _is_pandas_installed and isinstance(data, (pd.Series, pd.DataFrame, pd.Index)):
+                parent[key] = cls.__serialize_numpy(data, sidecar)
+            elif not isinstance(data, dict):
+                raise TypeError("Type %s not data-serializable" % typ)
+            elif typ is dict and all([type(k) is str for k in data]) \
+                    or not isinstance(data, OrderedDict) and all([isinstance(k, str) for k in data]):
+                enter(data)
+                parent[key] = res = dict.fromkeys(data)
+                push(data.items(), res)
+            else:
+                enter(data)
+                res = [[None, None] for _ in range(len(data))]
+                parent[key] = {"odic" if isinstance(data, OrderedDict) else "dic": res}
+                for (i, item) in enumerate(data.items()):
+                    push(enumerate(item), res[i])
+        return root[0]
+
+    #/************************************************************************/
+    @classmethod
+    def __tag(cls, tag, value):
+        # namespace the tag so that it is not mistaken for some ordinary key
+        return {cls.TAG: tag, tag: value}
+
+    #/************************************************************************/
+    @classmethod
+    def __serialize_numpy(cls, data, sidecar=None):
+        # tag arrays, series, indexes and dataframes
+        if not _is_pandas_installed or isinstance(data, np.ndarray):
+            pass
+        elif isinstance(data, pd.DataFrame):
+            return cls.__tag("pdf", {"columns": cls.serialize(list(data.columns)),
+                            "index": cls.__serialize_numpy(data.index, sidecar),
+                            "data": [cls.__serialize_numpy(data.iloc[:,i].to_numpy(), sidecar)
+                                     for i in range(data.shape[1])]})
+        elif isinstance(data, pd.Series):
+            return cls.__tag("pds", {"name": cls.serialize(data.name),
+                                     "index": cls.__serialize_numpy(data.index, sidecar),
+                                     "data": cls.__serialize_numpy(data.to_numpy(), sidecar)})
+        elif isinstance(data, pd.RangeIndex):
+            return cls.__tag("pdr", [data.start, data.stop, data.step, cls.serialize(data.name)])
+        elif isinstance(data, pd.Index):
+            return cls.__tag("pdi", {"name": cls.serialize(data.name),
+                                     "data": cls.__serialize_numpy(data.to_numpy(), sidecar)})
+        if data.dtype.hasobject:
+            return cls.__tag("nda", {"dtype": "object", "shape": list(data.shape),
+                                     "list": cls.serialize(data.ravel().tolist(), sidecar)})
+        elif sidecar is not None and data.nbytes >= cls.SIDECAR_SIZE:
+            os.makedirs(sidecar, exist_ok=True)
+            name = '%s.npy' % uuid.uuid4().hex # relative to the sidecar directory
+            np.save(osp.join(sidecar, name), data, allow_pickle=False)
+            return cls.__tag("npy", name)
+        dtype = data.dtype.str if data.dtype.fields is None else [list(d) for d in data.dtype.descr]
+        return cls.__tag("nda", {"dtype": dtype, "shape": list(data.shape),
+                                 "data": base64.b64encode(data.tobytes()).decode('ascii')})
 
     #/************************************************************************/
     @classmethod
-    def restore(cls, dct):
+    def restore(cls, dct, sidecar=None):
         """
+            >>> res = Json.restore(dct, sidecar=None)
+
+        Keyword arguments
+        -----------------
+        sidecar : str
+            directory of the :literal:`.npy` files of the arrays saved apart by
+            :meth:`~Json.serialize`; it is required to restore them, and only files
+            within it are loaded.
         """
         if "dic" in dct:            return dict(dct["dic"])
         elif "tup" in dct:          return tuple(dct["tup"])
         elif "set" in dct:          return set(dct["set"])
         elif "odic" in dct:         return OrderedDict(dct["odic"])
+        tag = dct.get(cls.TAG)
+        if tag not in ("nda", "npy", "pdr", "pdi", "pds", "pdf") or len(dct) != 2 or tag not in dct:
+            return dct
+        elif _is_numpy_installed is False or tag.startswith("pd") and _is_pandas_installed is False:
+            raise IOError("Module %s required to restore tag '%s'" % ("pandas" if tag.startswith("pd") else "numpy", tag))
+        elif tag == "nda":
+            arr = dct["nda"]
+            if arr["dtype"] == "object":
+                res = np.empty(len(arr["list"]), dtype=object)
+                res[:] = arr["list"]
+                return res.reshape(arr["shape"])
+            dtype = np.dtype(arr["dtype"] if isinstance(arr["dtype"], str) else [tuple(d) for d in arr["dtype"]])
+            return np.frombuffer(bytearray(base64.b64decode(arr["data"])), dtype=dtype).reshape(arr["shape"])
+        elif tag == "npy":
+            # the file shall lie in an explicit sidecar directory: loaded data
+            # cannot point anywhere on disk
+            path = dct["npy"]
+            if sidecar is None:
+                raise IOError("Sidecar directory required to restore array '%s'" % path)
+            elif not isinstance(path, string_types) or osp.isabs(path) or osp.splitdrive(path)[0] \
+                    or '..' in path.replace('\\', '/').split('/'):
+                raise IOError("Wrong path '%s' of array in sidecar directory" % path)
+            return np.load(osp.join(sidecar, path), allow_pickle=False)
+        elif tag == "pdr":
+            start, stop, step, name = dct["pdr"]
+            return pd.RangeIndex(start, stop, step, name=name)
+        elif tag == "pdi":
+            return pd.Index(dct["pdi"]["data"], name=dct["pdi"]["name"])
+        elif tag == "pds":
+            return pd.Series(dct["pds"]["data"], index=dct["pds"]["index"], name=dct["pds"]["name"])
+        elif tag == "pdf":
+            frame = dct["pdf"]
+            df = pd.DataFrame(dict(enumerate(frame["data"])), index=frame["index"])
+            df.columns = frame["columns"] if frame["data"] else df.columns
+            return df
         return dct
 
+    #/************************************************************************/
+    @classmethod
+    def __restore_all(cls, data, sidecar=None):
+        # apply restore to all the dictionaries of some loaded data, innermost
+        # first, as object_hook would do
+        root = [data]
+        nodes, stack = [], [(data, root, 0)]
+        while stack:
+            data, parent, key = stack.pop()
+            if isinstance(data, dict):
+                nodes.append((data, parent, key))
+                stack.extend([(v, data, k) for (k, v) in data.items() if isinstance(v, (dict, list))])
+            elif isinstance(data, list):
+                stack.extend([(v, data, i) for (i, v) in enumerate(data) if isinstance(v, (dict, list))])
+        for (data, parent, key) in reversed(nodes):
+            parent[key] = cls.restore(data, sidecar=sidecar)
+        return root[0]
+
+    #/************************************************************************/
+    @staticmethod
+    def __backend(backend):
+        # check that a fast backend is available
+        return backend if {'orjson': _is_orjson_installed, 'ujson': _is_ujson_installed}.get(backend) else None
+
+    #/************************************************************************/
+    @classmethod
+    def __backend_dumps(cls, data, backend, **kwargs):
+        # encode with a fast backend, or return None when some settings cannot
+        # be passed to it
+        # ensure_ascii defaults to True in json, which the backends do not honour
+        if not set(kwargs).issubset({'sort_keys', 'indent', 'ensure_ascii'}) \
+                or kwargs.get('ensure_ascii', True) is not False:
+            return None
+        if backend == 'orjson':
+            if kwargs.get('indent') not in (None, 2):
+                return None
+            # datetimes are passed through so that they are rejected, as by json
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            if kwargs.get('sort_keys') is True:     option |= orjson.OPT_SORT_KEYS
+            if kwargs.get('indent') == 2:           option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(data, option=option).decode('utf-8')
+            except (TypeError, OverflowError):
+                return None # let json raise (or succeed, e.g. with big integers)
+        elif backend == 'ujson':
+            try:
+                return ujson.dumps(data, escape_forward_slashes=False, **kwargs)
+            except (TypeError, OverflowError, ValueError):
+                return None
+        return None
+
     #/************************************************************************/
     @classmethod
     def dump(cls, data, f, **kwargs):
+        """
+            >>> Json.dump(data, f, serialize=False, backend=Json.BACKEND, **kwargs)
+        """
         serialize = kwargs.pop('serialize', False)
+        sidecar = kwargs.pop('sidecar', None)
+        backend = cls.__backend(kwargs.pop('backend', cls.BACKEND))
         # note: when is_order_preserved is False, this entire class can actually be
         # ignored since the dump/load methods are exactly equivalent to the original
         # dump/load method of the json package
+        if serialize is True:
+            data = cls.serialize(data, sidecar=sidecar)
+        s = None if backend is None else cls.__backend_dumps(data, backend, **kwargs)
+        if s is not None:
+            f.write(s)
+            return
         nkwargs = Struct.inspect_kwargs(kwargs, json.dump)
-        try:        assert serialize is True
-        except:     json.dump(data, f, **nkwargs)
-        else:       json.dump(cls.serialize(data), f, **nkwargs)
+        json.dump(data, f, **nkwargs)
 
     #/************************************************************************/
     @classmethod
     def dumps(cls, data, **kwargs):
         """
+            >>> s = Json.dumps(data, serialize=False, backend=Json.BACKEND, **kwargs)
+
+        Note
+        ----
+        A fast :data:`backend` (:literal:`'orjson'` or :literal:`'ujson'`) is only
+        used when explicitly set, and together with :data:`ensure_ascii=False`;
+        it writes NaN and infinity as :literal:`null`, and compact separators.
+        Unlike :mod:`json`, :literal:`'orjson'` also encodes :class:`uuid.UUID`,
+        dataclass and :class:`enum.Enum` values instead of raising a :class:`TypeError`.
         """
         serialize = kwargs.pop('serialize', False)
+        sidecar = kwargs.pop('sidecar', None)
+        backend = cls.__backend(kwargs.pop('backend', cls.BACKEND))
+        if serialize is True:
+            data = cls.serialize(data, sidecar=sidecar)
+        s = None if backend is None else cls.__backend_dumps(data, backend, **kwargs)
+        if s is not None:
+            return s
         nkwargs = Struct.inspect_kwargs(kwargs, json.dumps)
-        try:        assert serialize is True
-        except:     return json.dumps(data, **nkwargs)
-        else:       return json.dumps(cls.serialize(data), **nkwargs)
+        return json.dumps(data, **nkwargs)
 
     #/************************************************************************/
     @classmethod
     def load(cls, s, **kwargs):
         """
+            >>> data = Json.load(f, serialize=False, backend=Json.BACKEND, **kwargs)
         """
+        backend = cls.__backend(kwargs.get('backend', cls.BACKEND))
+        if backend is not None and Struct.inspect_kwargs(kwargs, json.load) == {}:
+            return cls.loads(s.read(), **kwargs)
         serialize = kwargs.pop('serialize', False)
+        sidecar = kwargs.pop('sidecar', None)
         nkwargs = Struct.inspect_kwargs(kwargs, json.load)
         try:        assert serialize is True
         except:     return json.load(s, **nkwargs)
-        else:       return json.load(s, object_hook=cls.restore, **nkwargs)
+        else:       return json.load(s, object_hook=partial(cls.restore, sidecar=sidecar), **nkwargs)
 
     #/************************************************************************/
     @classmethod
     def loads(cls, s, **kwargs):
         """
+            >>> data = Json.loads(s, serialize=False, backend=Json.BACKEND, **kwargs)
+
+        Note
+        ----
+        Unlike :mod:`json`, the :literal:`'orjson'` backend rejects the :literal:`NaN`
+        and :literal:`Infinity` literals (as written by :meth:`~Json.dumps` with
+        :mod:`json`) with a :class:`ValueError`.
         """
         serialize = kwargs.pop('serialize', False)
+        sidecar = kwargs.pop('sidecar', None)
+        backend = cls.__backend(kwargs.pop('backend', cls.BACKEND))
         nkwargs = Struct.inspect_kwargs(kwargs, json.loads)
+        if backend is not None and nkwargs == {}:
+            # fast backends do not support hooks: the data are restored afterwards
+            data = orjson.loads(s) if backend == 'orjson' else ujson.loads(s)
+            return cls.__restore_all(data, sidecar=sidecar) if serialize is True else data
         try:        assert serialize is True
-        except:     return json.loads(s, **kwargs)
-        else:       return json.loads(s, object_hook=cls.restore, **nkwargs)
+        except:     return json.loads(s, **nkwargs)
+        else:       return json.loads(s, object_hook=partial(cls.restore, sidecar=sidecar), **nkwargs)
+
+    #/************************************************************************/
+    @classmethod
+    def iter_load(cls, src, **kwargs):
+        """Iterate over the records of a line-delimited (NDJSON) JSON source.
+
+            >>> for record in Json.iter_load(src, serialize=False, **kwargs):
+            ...     pass
+
+        Arguments
+        ---------
+        src : str, file
+            name of the file, or stream, with one JSON document per line.
+
+        Keyword arguments
+        -----------------
+        kwargs :
+            keyword arguments passed to :meth:`~Json.loads` for each line, *e.g.*
+            :data:`serialize` to restore the tagged types.
+
+        Returns
+        -------
+        record : generator
+            the records are decoded lazily, one line at a time; blank lines are
+            ignored.
+        """
+        if isinstance(src, string_types):
+            with open(src, 'rb') as f:
+                yield from cls.iter_load(f, **kwargs)
+            return
+        for line in src:
+            if line.strip():
+                yield cls.loads(line, **kwargs)
+
+    #/************************************************************************/
+    @classmethod
+    def dump_iter(cls, data, f, **kwargs):
+        """Write records as line-delimited (NDJSON) JSON.
+
+            >>> n = Json.dump_iter(data, f, batch=Json.NDJSON_BATCH, serialize=False, **kwargs)
+
+        Arguments
+        ---------
+        data : iterable
+            records to write, consumed lazily.
+        f : str, file
+            name of the file, or stream (in text or binary mode), to write into.
+
+        Keyword arguments
+        -----------------
+        batch : int
+            number of records encoded before a write; default: :data:`NDJSON_BATCH`.
+        kwargs :
+            keyword arguments passed to :meth:`~Json.dumps` for each record, *e.g.*
+            :data:`serialize` to tag the types; :data:`indent` is ignored.
+
+        Returns
+        -------
+        n : int
+            number of records written.
+        """
+        batch = kwargs.pop('batch', None) or cls.NDJSON_BATCH
+        kwargs.pop('indent', None) # one record per line
+        if isinstance(f, string_types):
+            with open(f, 'w', encoding='utf-8') as fp:
+                return cls.dump_iter(data, fp, batch=batch, **kwargs)
+        binary = isinstance(f, (io.RawIOBase, io.BufferedIOBase)) or 'b' in getattr(f, 'mode', '')
+        n, lines = 0, []
+        for record in data:
+            lines.append(cls.dumps(record, **kwargs))
+            if len(lines) >= batch:
+                n += len(lines)
+                lines.append('')
+                f.write('\n'.join(lines).encode('utf-8') if binary else '\n'.join(lines))
+                lines = []
+        if lines:
+            n += len(lines)
+            lines.append('')
+            f.write('\n'.join(lines).encode('utf-8') if binary else '\n'.join(lines))
+        return n
 
     #/************************************************************************/
     @staticmethod
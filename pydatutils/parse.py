@@ -138,6 +138,16 @@ class BaseParserCollection():
     KW_EXPIRE       = 'expire_after'
     KW_FORCE        = '_force_download_'
     KW_BACKEND      = 'cache_backend'
+    KW_STALE        = 'stale_while_revalidate'
+    KW_NEGATIVE     = 'negative_expire_after'
+    KW_TIMEOUT      = 'timeout'
+    KW_DEADLINE     = 'deadline'
+    KW_HEDGE        = 'hedge'
+    KW_CONCURRENCY  = 'concurrency'
+    KW_DECODE_EXECUTOR = 'decode_executor'
+    KW_TRANSPORT    = 'transport'
+    KW_DEDUP        = 'dedup'
+    KW_SHARED       = 'shared_cache'
 
     KW_REST_URL     = 'rest_url'
     KW_CACHE_URL    = 'cache_url'
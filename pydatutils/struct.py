@@ -435,6 +435,34 @@ class Type():
 
 class Struct():
 
+    # Cache of the parameters of the inspected methods/functions
+    __PARAMETERS = {}
+    __PARAMETERS_SIZE = 1024
+
+    #/************************************************************************/
+    @staticmethod
+    def inspect_parameters(method):
+        """Retrieve the names of the parameters in the signature of a method/function.
+
+            >>> keys = Struct.inspect_parameters(method)
+
+        Note
+        ----
+        Signatures are inspected once only: the parameters are cached per function,
+        so that the bound methods of different instances share the same entry.
+        """
+        key = (getattr(method, '__func__', method), hasattr(method, '__func__'))
+        try:
+            return Struct.__PARAMETERS[key]
+        except KeyError:
+            pass
+        except TypeError: # unhashable callable
+            return frozenset(inspect.signature(method).parameters)
+        if len(Struct.__PARAMETERS) >= Struct.__PARAMETERS_SIZE:
+            Struct.__PARAMETERS.clear()
+        keys = Struct.__PARAMETERS[key] = frozenset(inspect.signature(method).parameters)
+        return keys
+
     #/************************************************************************/
     @staticmethod
     def inspect_kwargs(kwargs, method):
@@ -442,12 +470,48 @@ class Struct():
         deleting all the keys that are not present in the signature of the method/function.
         """
         if kwargs == {}: return {}
-        kw = kwargs.copy() # deepcopy(kwargs)
-        parameters = inspect.signature(method).parameters
-        keys = [key for key in kwargs.keys()                                          \
-                if key not in list(parameters.keys()) or parameters[key].KEYWORD_ONLY.value == 0]
-        [kw.pop(key) for key in keys]
-        return kw
+        keys = Struct.inspect_parameters(method)
+        return {key: val for (key, val) in kwargs.items() if key in keys}
+
+    #/************************************************************************/
+    @staticmethod
+    def route_kwargs(kwargs, *methods, **kw):
+        """Split keyword parameters across several methods/functions, in a single
+        pass over the parameters.
+
+            >>> kw1, kw2, ... = Struct.route_kwargs(kwargs, method1, method2, ..., exclusive=False)
+
+        Arguments
+        ---------
+        kwargs : dict
+            keyword parameters to split.
+        methods : callable
+            methods/functions the parameters are routed to.
+
+        Keyword arguments
+        -----------------
+        exclusive : bool
+            flag set to route a parameter to the first method/function only whose
+            signature holds it, instead of all of them; default: :data:`False`.
+
+        Returns
+        -------
+        kw1, kw2, ... : dict
+            keyword parameters present in the signature of each method/function,
+            like :meth:`~Struct.inspect_kwargs` would return them.
+        """
+        exclusive = kw.pop('exclusive', False)
+        routes = [{} for _ in methods]
+        if kwargs == {}:
+            return routes
+        keys = [Struct.inspect_parameters(m) for m in methods]
+        for (key, val) in kwargs.items():
+            for (i, params) in enumerate(keys):
+                if key in params:
+                    routes[i][key] = val
+                    if exclusive is True:
+                        break
+        return routes
 
     #/************************************************************************/
     @staticmethod
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Tests of the :mod:`pydatutils.io` module.
+"""
+
+from collections import OrderedDict
+
+import pytest
+
+from pydatutils.io import Json
+
+
+def test_serialize_format():
+    data = {'t': (1, 2), 's': {3}, 'd': {1: 'a'}, 'o': OrderedDict([('x', 1)])}
+    assert Json.serialize(data) == {'t': {'tup': [1, 2]}, 's': {'set': [3]},
+                                    'd': {'dic': [[1, 'a']]}, 'o': {'odic': [['x', 1]]}}
+
+
+def test_serialize_round_trip():
+    data = {'t': (1, (2, 3)), 's': {1, 2}, 'd': {1: 'a', (2, 3): [4, {5}]},
+            'o': OrderedDict([('b', 1), ('a', (2,))]), 'l': [None, True, 1.5, 'x']}
+    res = Json.loads(Json.dumps(data, serialize=True), serialize=True)
+    assert res == data
+    assert type(res['o']) is OrderedDict and list(res['o']) == ['b', 'a']
+    assert type(res['d'][(2, 3)][1]) is set
+
+
+def test_serialize_deep_nesting():
+    data = leaf = []
+    for _ in range(10000):
+        leaf.append([])
+        leaf = leaf[0]
+    res = Json.serialize(data)
+    for _ in range(10000):
+        res = res[0]
+    assert res == []
+
+
+def test_serialize_circular_reference():
+    shared = [1]
+    assert Json.serialize([shared, shared, (shared,)]) == [[1], [1], {'tup': [[1]]}]
+    data = {'a': [1]}
+    data['a'].append(data)
+    with pytest.raises(ValueError):
+        Json.serialize(data)
+
+
+def test_serialize_numpy_round_trip(tmp_path):
+    np = pytest.importorskip('numpy')
+    data = {'i': np.arange(6, dtype='>i2').reshape(2, 3), 'f': np.float32(1.5),
+            'r': np.zeros(2, dtype=[('a', '<u1'), ('b', '<f8')]),
+            'o': np.array([1, 'a', None], dtype=object)}
+    res = Json.loads(Json.dumps(data, serialize=True), serialize=True)
+    for key in ('i', 'r', 'o'):
+        assert res[key].dtype == data[key].dtype and res[key].shape == data[key].shape
+        assert (res[key] == data[key]).all()
+    assert res['f'] == 1.5
+    # large arrays are saved apart, and only restored from the sidecar directory
+    big = np.arange(Json.SIDECAR_SIZE // 8, dtype='<f8')
+    s = Json.dumps({'a': big}, serialize=True, sidecar=str(tmp_path))
+    assert (Json.loads(s, serialize=True, sidecar=str(tmp_path))['a'] == big).all()
+    with pytest.raises(IOError):
+        Json.loads(s, serialize=True)
+    for path in (str(tmp_path / 'x.npy'), '../x.npy', 'a/../../x.npy'):
+        with pytest.raises(IOError):
+            Json.restore({Json.TAG: 'npy', 'npy': path}, sidecar=str(tmp_path))
+
+
+def test_serialize_pandas_round_trip():
+    pd = pytest.importorskip('pandas')
+    index = pd.Index(['x', 'y', 'z'], name='key')
+    series = pd.Series([1.5, 2.5, None], index=index, name='s')
+    frame = pd.DataFrame({'a': [1, 2, 3], 'b': ['u', 'v', 'w'], 3: [True, False, True]},
+                         index=pd.RangeIndex(10, 16, 2, name='r'))
+    res = Json.loads(Json.dumps({'s': series, 'f': frame}, serialize=True), serialize=True)
+    pd.testing.assert_series_equal(res['s'], series)
+    pd.testing.assert_frame_equal(res['f'], frame)
+    assert list(res['f'].dtypes) == list(frame.dtypes)
+
+
+def test_ndjson_round_trip(tmp_path):
+    records = [{'a': i, 't': (i, 'x')} for i in range(5)]
+    path = str(tmp_path / 'data.ndjson')
+    assert Json.dump_iter(iter(records), path, batch=2, serialize=True, indent=4) == 5
+    with open(path) as f:
+        assert len(f.read().splitlines()) == 5
+    assert list(Json.iter_load(path, serialize=True)) == records
+
+
+def test_ndjson_binary_and_blank_lines(tmp_path):
+    path = str(tmp_path / 'data.ndjson')
+    with open(path, 'wb') as f:
+        assert Json.dump_iter([{'a': 1}, [2, 'é']], f, ensure_ascii=False) == 2
+        f.write(b'\n  \n')
+        Json.dump_iter([None], f)
+    with open(path, 'rb') as f:
+        assert list(Json.iter_load(f)) == [{'a': 1}, [2, 'é'], None]
+    with open(path, encoding='utf-8') as f:
+        assert list(Json.iter_load(f)) == [{'a': 1}, [2, 'é'], None]
+
+
+def test_ndjson_orjson(tmp_path):
+    pytest.importorskip('orjson')
+    records = [{'a': (1, 2)}, {'b': {3}}]
+    path = str(tmp_path / 'data.ndjson')
+    with open(path, 'wb') as f:
+        Json.dump_iter(records, f, serialize=True, backend='orjson', ensure_ascii=False)
+    # binary lines are decoded by orjson directly
+    assert list(Json.iter_load(path, serialize=True, backend='orjson')) == records